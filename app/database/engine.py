@@ -1,7 +1,6 @@
 # app/database/engine.py
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
 import logging
 
@@ -14,43 +13,58 @@ if not DATABASE_URL:
     logger.error("DATABASE_URL not set in environment variables")
     raise ValueError("DATABASE_URL not set")
 
+# Pool and asyncpg statement-cache sizing, tunable per deployment
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Pre-ping costs a round-trip per checkout; stale connections are instead caught by
+# recycling and TCP keepalives. Can be re-enabled for unreliable networks.
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
 try:
     engine = create_async_engine(
         DATABASE_URL,
-        echo=True,
-        pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-        connect_args={"server_settings": {"application_name": "rag_chat_service"}}
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+        echo_pool=False,
+        # Room for every distinct statement shape so none is recompiled after warm-up
+        query_cache_size=1200,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        connect_args={
+            "server_settings": {
+                "application_name": "rag_chat_service",
+                # Have the server probe idle connections so dead peers are dropped
+                "tcp_keepalives_idle": "60",
+                "tcp_keepalives_interval": "10",
+                "tcp_keepalives_count": "5"
+            },
+            # asyncpg's own cache and SQLAlchemy's asyncpg adapter cache
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE
+        }
     )
 except Exception as e:
     logger.error(f"Failed to create database engine: {str(e)}")
     raise
 
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
-    autocommit=False,
     autoflush=False
 )
 
 async def get_db():
     """
     Dependency that provides a database session for FastAPI routes.
-    This function creates a new database session for each request and ensures it is properly closed after use.
+    This function creates a new database session for each request; the session's context manager
+    rolls back any open transaction and closes it after use, including when the request fails.
     Yields:
         AsyncSession: A database session for the request.
-    Raises:
-        Exception: If an error occurs during session creation or rollback.
     """
-    session = AsyncSessionLocal()
-    try:
+    async with AsyncSessionLocal() as session:
         yield session
-    except Exception as e:
-        await session.rollback()
-        logger.error(f"Database session error: {str(e)}")
-        raise
-    finally:
-        await session.close()
-        
\ No newline at end of file
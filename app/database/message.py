@@ -1,10 +1,10 @@
 # app/database/models/message.py
-from sqlalchemy import Column, String, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, DateTime, JSON, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
+from uuid_utils.compat import uuid7
 from sqlalchemy.orm import DeclarativeBase
-import uuid
 from app.database.base import Base
-from app.utils.helper import utcnow_naive
+from app.utils.helper import utcnow
 
 class Message(Base):
     """
@@ -13,8 +13,20 @@ class Message(Base):
         content, context, and timestamp.
     """
     __tablename__ = "messages"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Serves per-session pagination ordered and seeked on (timestamp, id) as a plain index range scan
+        Index("ix_messages_session_ts", "session_id", "timestamp", "id"),
+    )
+
+    # Client-side v7 ids let insertmanyvalues batch and order create_many() in one statement (a
+    # server-generated key is no sentinel); the server default only covers rows inserted outside the service
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        insert_sentinel=True,
+        server_default=text("gen_random_uuid()")
+    )
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("chat_sessions.id", ondelete="CASCADE"),
@@ -23,4 +35,4 @@ class Message(Base):
     sender = Column(String, nullable=False)
     content = Column(String, nullable=False)
     context = Column(JSON, nullable=True)
-    timestamp = Column(DateTime(timezone=True), default=utcnow_naive)
\ No newline at end of file
+    timestamp = Column(DateTime(timezone=True), default=utcnow)
\ No newline at end of file
@@ -1,9 +1,9 @@
 # app/database/models/session.py
-import uuid
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
+from uuid_utils.compat import uuid7
 from app.database.base import Base
-from app.utils.helper import utcnow_naive
+from app.utils.helper import utcnow
 
 
 class ChatSession(Base):
@@ -11,7 +11,7 @@ class ChatSession(Base):
     This model stores the details of a chat session, including its name, user ID,
     favorite status, and timestamps for creation and last update.
     Attributes:
-        id (UUID): Unique identifier for the chat session.
+        id (UUID): Unique, time-ordered (UUIDv7) identifier for the chat session.
         name (str): Name of the chat session.
         user_id (str): Identifier for the user associated with the session.
         is_favorite (bool): Indicates if the session is marked as favorite.
@@ -19,10 +19,16 @@ class ChatSession(Base):
         updated_at (datetime): Timestamp when the session was last updated.
     """
     __tablename__ = "chat_sessions"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Leading user_id also serves plain per-user lookups
+        Index("ix_sessions_user_fav", "user_id", "is_favorite"),
+    )
+
+    # Time-ordered v7 ids append to the tail of the primary-key index instead of splitting random pages;
+    # the server default only covers rows inserted outside the service
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     name = Column(String, nullable=True)
     user_id = Column(String, nullable=False)
     is_favorite = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), default=utcnow_naive)
-    updated_at = Column(DateTime(timezone=True), default=utcnow_naive, onupdate=utcnow_naive)
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), default=utcnow)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
\ No newline at end of file
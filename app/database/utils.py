@@ -1,5 +1,6 @@
 # app/database/utils.py
 import logging
+import os
 from app.database.base import Base
 from .engine import engine
 
@@ -9,9 +10,13 @@ async def init_db():
     """Initialize the database by creating all tables.
     This function connects to the database and creates all tables defined in the Base metadata.
     It should be called during application startup to ensure the database schema is ready for use.
+    Table creation only runs when RUN_CREATE_ALL=true, so deployments with a managed schema skip it.
     Raises:
         Exception: If an error occurs during the database initialization process.
     """
+    if os.getenv("RUN_CREATE_ALL", "false").lower() != "true":
+        logger.info("Skipping database initialization (RUN_CREATE_ALL is not enabled)")
+        return
     logger.info("Initializing database...")
     try:
         async with engine.begin() as conn:
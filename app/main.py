@@ -1,37 +1,76 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.background import BackgroundTask
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from contextlib import asynccontextmanager
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIASGIMiddleware
 from app.routes import message, session
 from app.utils.logger import setup_logger
+from app.utils.rate_limiter import limiter
+from app.utils.auth import APIKeyMiddleware
 from app.database.utils import init_db
 import logging
+import os
+
+# Setup logger
+setup_logger()
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting up application")
+    await init_db()
+    yield
+    logger.info("Shutting down application")
 
 # Initialize FastAPI app
 app = FastAPI(
     title="RAG Chat Storage Microservice",
     description="API for storing and managing RAG-based chat sessions",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Setup logger
-setup_logger()
-logger = logging.getLogger(__name__)
+# Reject requests without a valid API key before routing. Added before the rate limiter so
+# it runs inside it and failed attempts still count against the client's limit.
+app.add_middleware(APIKeyMiddleware)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Register the shared rate limiter; the pure ASGI middleware applies its default limit to every
+# route without BaseHTTPMiddleware's per-request wrapping
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.add_middleware(SlowAPIASGIMiddleware)
+
+# The docs and OpenAPI schema routes are created by FastAPI itself; keep them out of the default limit
+_docs_urls = {app.openapi_url, app.docs_url, app.swagger_ui_oauth2_redirect_url, app.redoc_url}
+for route in app.routes:
+    if getattr(route, "path", None) in _docs_urls:
+        limiter.exempt(route.endpoint)
+
+# Catch-all for unexpected errors; HTTPExceptions keep FastAPI's own handler.
+# Starlette re-raises after sending this response, so uvicorn still logs the traceback on its own
+# (non-propagating) logger; this record supplements it so the error also reaches app.log.
+# It is written in a background task so the 500 is sent before the log is formatted.
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+        background=BackgroundTask(
+            logger.error, "Unhandled error on %s %s", request.method, request.url.path, exc_info=exc
+        )
+    )
 
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Adjust in production
+    allow_origins=[origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "X-API-Key"],
 )
 
 # Include routes
@@ -41,12 +80,6 @@ app.include_router(session.router, prefix="/chat", tags=["Session"])
 
 # Health check endpoint
 @app.get("/health")
+@limiter.exempt
 async def health_check():
     return {"status": "healthy"}
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Starting up application")
-    await init_db()
-    yield
-    logger.info("Shutting down application")
@@ -1,12 +1,14 @@
-from pydantic import BaseModel
-from datetime import datetime, timezone
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
 from typing import Optional, List, Dict
+from app.utils.helper import utcnow
 
 class Message(BaseModel):
     """Model representing a chat message in a session.
     Attributes:
         id (str): Unique identifier for the message.
-        session_id (str): Identifier for the chat session.
+        session_id (Optional[UUID]): Identifier for the chat session.
         sender (str): Identifier for the sender of the message.
         content (str): Content of the message.
         context (Optional[Dict]): Additional context or metadata for the message.
@@ -15,21 +17,23 @@ class Message(BaseModel):
     sender: str
     content: str
     context: Optional[Dict] = None
-    timestamp: datetime = datetime.now(timezone.utc)
-    session_id: Optional[str] = None  # Added to accept session_id
+    timestamp: datetime = Field(default_factory=utcnow)
+    session_id: Optional[UUID] = None  # Added to accept session_id
 
 class MessageResponse(BaseModel):
     """Response model for a chat message.
     Attributes:
-        id (str): Unique identifier for the message.
-        session_id (str): Identifier for the chat session.
+        id (UUID): Unique identifier for the message.
+        session_id (UUID): Identifier for the chat session.
         sender (str): Identifier for the sender of the message.
         content (str): Content of the message.
         context (Optional[Dict]): Additional context or metadata for the message.
         timestamp (datetime): Timestamp when the message was created.
     """
-    id: str
-    session_id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    session_id: UUID
     sender: str
     content: str
     context: Optional[Dict]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from app.models.message import MessageResponse
 
 
@@ -7,11 +7,13 @@ class PaginatedMessages(BaseModel):
     """Model for paginated messages response
     Attributes:
         messages (List[MessageResponse]): List of messages in the current page.
-        total (int): Total number of messages across all pages.
-        page (int): Current page number.
+        total (Optional[int]): Total number of messages across all pages; None when paginating by cursor.
+        page (Optional[int]): Current page number; None when paginating by cursor.
         page_size (int): Number of messages per page.
+        next_cursor (Optional[str]): Opaque cursor for the next page, or None on the last page.
     """
     messages: List[MessageResponse]
-    total: int
-    page: int
-    page_size: int
\ No newline at end of file
+    total: Optional[int] = None
+    page: Optional[int] = None
+    page_size: int
+    next_cursor: Optional[str] = None
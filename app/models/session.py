@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime, timezone
 from typing import Optional, List, Dict
 
@@ -23,14 +24,16 @@ class ChatSessionUpdate(BaseModel):
 class ChatSessionResponse(BaseModel):
     """Response model for a chat session.
     Attributes:
-        id (str): Unique identifier for the chat session.
+        id (UUID): Unique identifier for the chat session.
         name (Optional[str]): Name of the chat session.
         user_id (str): Identifier for the user associated with the session.
         is_favorite (bool): Indicates if the session is marked as favorite.
         created_at (datetime): Timestamp when the session was created.
         updated_at (datetime): Timestamp when the session was last updated.
     """
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     name: Optional[str]
     user_id: str
     is_favorite: bool
@@ -1,9 +1,9 @@
 import logging
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, insert, update, delete
 from fastapi import HTTPException, status
-from typing import TypeVar, Generic, Type, Dict
+from typing import TypeVar, Generic, Type, Union
 from sqlalchemy.orm import DeclarativeBase
 from pydantic import BaseModel
 
@@ -19,7 +19,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
     """
     A generic base repository class for CRUD operations on SQLAlchemy models.
     This class provides methods to create, read, update, and delete records in the database.
-    It also handles UUID conversion for fields that require it.
+    Response schemas are expected to set `from_attributes=True` so ORM instances and RETURNING rows can be validated directly.
     Attributes:
         model (Type[ModelType]): The SQLAlchemy model class to operate on.
         db (AsyncSession): The database session to use for operations.
@@ -37,25 +37,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
         self.model = model
         self.db = db
         self.response_schema = response_schema
-
-    def _prepare_data(self, data: Dict) -> Dict:
-        """
-        Prepares the data dictionary by converting UUID fields to strings.
-        This is necessary for compatibility with Pydantic models and JSON serialization.
-        Args:
-            data (Dict): The data dictionary to prepare.
-        Returns:
-            Dict: The prepared data dictionary with UUIDs converted to strings.
-        """
-        logger.debug(f"Preparing data for {self.model.__name__}: {data}")
-        # Convert UUID fields to strings
-        prepared_data = data.copy()
-        for key, value in prepared_data.items():
-            if isinstance(value, uuid.UUID):
-                logger.debug(f"Converting {key} to string: {value}")
-                prepared_data[key] = str(value)
-        logger.debug(f"Prepared data: {prepared_data}")
-        return prepared_data
+        # Resolve the primary key column and its type once instead of on every call
+        self._pk_col = model.__table__.c.id if hasattr(model, 'id') else None
+        self._id_is_uuid = self._pk_col is not None and self._pk_col.type.python_type is uuid.UUID
 
     async def create(self, data: CreateSchemaType) -> ResponseSchemaType:
         """
@@ -68,24 +52,27 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
             HTTPException: If an error occurs during creation, a 500 Internal Server Error is raised.
         """
         try:
-            # Convert Pydantic model to dict and create SQLAlchemy model instance
-            db_instance = self.model(**data.model_dump())
-            self.db.add(db_instance)
-            await self.db.flush()  # Ensure ID is assigned
+            # Single round-trip: insert the row and read it back, server defaults included, via RETURNING
+            result = await self.db.execute(
+                insert(self.model)
+                .values(**data.model_dump())
+                .returning(*self.model.__table__.c)
+            )
+            row = result.one()
             await self.db.commit()
-            await self.db.refresh(db_instance)
-            logger.info(f"Created {self.model.__name__} with ID {getattr(db_instance, 'id', 'unknown')}")
-            return self.response_schema.model_validate(self._prepare_data(db_instance.__dict__))
+            logger.info("Created %s with ID %s", self.model.__name__, getattr(row, 'id', 'unknown'))
+            # Rows expose columns as attributes, so from_attributes validates them without a dict copy
+            return self.response_schema.model_validate(row)
         except Exception as e:
-            logger.error(f"Error creating {self.model.__name__}: {str(e)}")
+            logger.error("Error creating %s: %s", self.model.__name__, e)
             await self.db.rollback()
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to create {self.model.__name__.lower()}")
 
-    async def update(self, id: str, data: UpdateSchemaType) -> ResponseSchemaType:
+    async def update(self, id: Union[uuid.UUID, str], data: UpdateSchemaType) -> ResponseSchemaType:
         """
         Updates an existing record in the database with the provided ID and data.
         Args:
-            id (str): The ID of the record to update.
+            id (Union[uuid.UUID, str]): The ID of the record to update.
             data (UpdateSchemaType): The data to update the record with.
         Returns:
             ResponseSchemaType: The response schema instance containing the updated record.
@@ -94,39 +81,36 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
             HTTPException: If an error occurs during update, a 500 Internal Server Error is raised.
         """
         try:
-            # Convert ID to UUID if applicable
-            id_value = uuid.UUID(id) if hasattr(self.model, 'id') and self.model.__table__.c.id.type.python_type == uuid.UUID else id
-            result = await self.db.execute(
-                select(self.model).filter(self.model.id == id_value)
-            )
-            db_instance = result.scalar_one_or_none()
-            if not db_instance:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{self.model.__name__} not found")
-            
+            # Convert ID to UUID if applicable and not already parsed
+            id_value = uuid.UUID(id) if self._id_is_uuid and not isinstance(id, uuid.UUID) else id
             update_data = data.model_dump(exclude_unset=True)
-            await self.db.execute(
+            # Single round-trip: update the row and read it back via RETURNING
+            result = await self.db.execute(
                 update(self.model)
-                .where(self.model.id == id_value)
+                .where(self._pk_col == id_value)
                 .values(**update_data)
+                .returning(*self.model.__table__.c)
             )
+            row = result.first()
+            if row is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{self.model.__name__} not found")
             await self.db.commit()
-            await self.db.refresh(db_instance)
-            logger.info(f"Updated {self.model.__name__} with ID {id}")
-            return self.response_schema.model_validate(self._prepare_data(db_instance.__dict__))
+            logger.info("Updated %s with ID %s", self.model.__name__, id)
+            return self.response_schema.model_validate(row)
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ID format")
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating {self.model.__name__}: {str(e)}")
+            logger.error("Error updating %s: %s", self.model.__name__, e)
             await self.db.rollback()
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update {self.model.__name__.lower()}")
 
-    async def delete(self, id: str) -> dict:
+    async def delete(self, id: Union[uuid.UUID, str]) -> dict:
         """
         Deletes an existing record in the database with the provided ID.
         Args:
-            id (str): The ID of the record to delete.
+            id (Union[uuid.UUID, str]): The ID of the record to delete.
         Returns:
             dict: A dictionary containing a success message.
         Raises:
@@ -134,33 +118,33 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
             HTTPException: If an error occurs during deletion, a 500 Internal Server Error is raised.
         """
         try:
-            # Convert ID to UUID if applicable
-            id_value = uuid.UUID(id) if hasattr(self.model, 'id') and self.model.__table__.c.id.type.python_type == uuid.UUID else id
+            # Convert ID to UUID if applicable and not already parsed
+            id_value = uuid.UUID(id) if self._id_is_uuid and not isinstance(id, uuid.UUID) else id
+            # Single round-trip: delete the row and confirm it existed via RETURNING
             result = await self.db.execute(
-                select(self.model).filter(self.model.id == id_value)
+                delete(self.model)
+                .where(self._pk_col == id_value)
+                .returning(self._pk_col)
             )
-            db_instance = result.scalar_one_or_none()
-            if not db_instance:
+            if result.scalar_one_or_none() is None:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{self.model.__name__} not found")
-            
-            await self.db.delete(db_instance)
             await self.db.commit()
-            logger.info(f"Deleted {self.model.__name__} with ID {id}")
+            logger.info("Deleted %s with ID %s", self.model.__name__, id)
             return {"message": f"{self.model.__name__} deleted successfully"}
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ID format")
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error deleting {self.model.__name__}: {str(e)}")
+            logger.error("Error deleting %s: %s", self.model.__name__, e)
             await self.db.rollback()
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to delete {self.model.__name__.lower()}")
 
-    async def get(self, id: str) -> ResponseSchemaType:
+    async def get(self, id: Union[uuid.UUID, str]) -> ResponseSchemaType:
         """
         Retrieves a record from the database by its ID.
         Args:
-            id (str): The ID of the record to retrieve.
+            id (Union[uuid.UUID, str]): The ID of the record to retrieve.
         Returns:
             ResponseSchemaType: The response schema instance containing the retrieved record.
         Raises:
@@ -168,19 +152,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Resp
             HTTPException: If an error occurs during retrieval, a 500 Internal Server Error is raised.
         """
         try:
-            # Convert ID to UUID if applicable
-            id_value = uuid.UUID(id) if hasattr(self.model, 'id') and self.model.__table__.c.id.type.python_type == uuid.UUID else id
+            # Convert ID to UUID if applicable and not already parsed
+            id_value = uuid.UUID(id) if self._id_is_uuid and not isinstance(id, uuid.UUID) else id
             result = await self.db.execute(
-                select(self.model).filter(self.model.id == id_value)
+                select(self.model).filter(self._pk_col == id_value)
             )
             db_instance = result.scalar_one_or_none()
             if not db_instance:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{self.model.__name__} not found")
-            return self.response_schema.model_validate(self._prepare_data(db_instance.__dict__))
+            return self.response_schema.model_validate(db_instance)
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ID format")
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving {self.model.__name__}: {str(e)}")
+            logger.error("Error retrieving %s: %s", self.model.__name__, e)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to retrieve {self.model.__name__.lower()}")
\ No newline at end of file
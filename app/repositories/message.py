@@ -1,16 +1,22 @@
 import logging
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from datetime import datetime
+from sqlalchemy import select, insert, func, tuple_, Select, RowMapping
+from typing import List, Optional, Tuple, Union
 from fastapi import HTTPException, status
 
 from app.database.message import Message as SQLAlchemyMessage
 from app.models.message import Message, MessageResponse
 from app.models.pagination import PaginatedMessages
 from app.repositories.base import BaseRepository
+from app.utils.helper import encode_cursor
 
 logger = logging.getLogger(__name__)
 
+# Pages larger than this are streamed from a server-side cursor in chunks of this size
+STREAM_YIELD_PER = 200
+
 class MessageRepository(BaseRepository[SQLAlchemyMessage, Message, Message, MessageResponse]):
     """
     A repository for managing messages in the database.
@@ -26,44 +32,143 @@ class MessageRepository(BaseRepository[SQLAlchemyMessage, Message, Message, Mess
         """
         super().__init__(SQLAlchemyMessage, db, MessageResponse)
 
+    async def create_many(self, items: List[Message]) -> List[MessageResponse]:
+        """
+        Creates multiple messages with a batched INSERT ... RETURNING (SQLAlchemy's insertmanyvalues).
+        Args:
+            items (List[Message]): The messages to create.
+        Returns:
+            List[MessageResponse]: The created messages, in the order they were given.
+        Raises:
+            HTTPException: If an error occurs during creation, a 500 Internal Server Error is raised.
+        """
+        if not items:
+            return []
+        try:
+            # A multi-row VALUES insert does not guarantee RETURNING order, so ask SQLAlchemy to sort by
+            # parameter order; the client-generated id is the sentinel that keeps this a single batch
+            result = await self.db.execute(
+                insert(self.model).returning(*self.model.__table__.c, sort_by_parameter_order=True),
+                [item.model_dump() for item in items]
+            )
+            rows = result.mappings().all()
+            await self.db.commit()
+            logger.info("Created %d %s records", len(rows), self.model.__name__)
+            return [self.response_schema.model_validate(dict(row)) for row in rows]
+        except Exception as e:
+            logger.error("Error creating %s batch: %s", self.model.__name__, e)
+            await self.db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create messages")
 
-    async def get_by_session_id(self, session_id: str, page: int = 1, page_size: int = 10) -> PaginatedMessages:
+    async def get_by_session_id(
+        self,
+        session_id: Union[uuid.UUID, str],
+        page: int = 1,
+        page_size: int = 10,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> PaginatedMessages:
         """
-        Retrieves messages associated with a specific session ID, with pagination support.
+        Retrieves messages associated with a specific session ID, newest first, with pagination support.
+        When a cursor is given, keyset pagination is used and `page` is ignored; page-based
+        (OFFSET) pagination is kept for backward compatibility but is deprecated.
         Args:
-            session_id (str): The UUID of the session to retrieve messages for.
-            page (int): The page number to retrieve (default is 1).
+            session_id (Union[uuid.UUID, str]): The UUID of the session to retrieve messages for.
+            page (int): The page number to retrieve (default is 1). Deprecated in favour of `cursor`.
             page_size (int): The number of messages per page (default is 10).
+            cursor (Optional[Tuple[datetime, uuid.UUID]]): The (timestamp, id) of the last message
+                of the previous page, as returned in `next_cursor`.
         Returns:
             PaginatedMessages: A paginated response containing messages and metadata.
         Raises:
             HTTPException: If the session ID is invalid or if an error occurs during retrieval.
         """
-        logger.debug(f"Retrieving messages for session ID: {session_id}, page: {page}, page_size: {page_size}")
+        logger.debug("Retrieving messages for session ID: %s, page: %s, page_size: %s, cursor: %s", session_id, page, page_size, cursor)
         try:
-            session_id_value = uuid.UUID(session_id)
-            # Count total messages
-            count_result = await self.db.execute(
-                select(func.count()).select_from(self.model).filter(self.model.session_id == session_id_value)
-            )
-            total = count_result.scalar_one()
+            session_id_value = session_id if isinstance(session_id, uuid.UUID) else uuid.UUID(session_id)
+            if cursor is not None:
+                return await self._get_page_by_cursor(session_id_value, page_size, cursor)
 
-            # Fetch paginated messages
-            result = await self.db.execute(
-                select(self.model)
+            offset = (page - 1) * page_size
+            # Fetch the page and the total count in one round-trip
+            rows = await self._fetch_rows(
+                select(*self.model.__table__.c, func.count().over().label("total"))
                 .filter(self.model.session_id == session_id_value)
-                .offset((page - 1) * page_size)
-                .limit(page_size)
+                .order_by(self.model.timestamp.desc(), self.model.id.desc())
+                .offset(offset)
+                .limit(page_size),
+                page_size
             )
-            messages = result.scalars().all()
+            if rows:
+                total = rows[0]["total"]
+            elif offset == 0:
+                total = 0
+            else:
+                # Page past the end: the window count is unavailable, so count separately
+                count_result = await self.db.execute(
+                    select(func.count(self.model.id)).where(self.model.session_id == session_id_value)
+                )
+                total = count_result.scalar_one()
+            has_more = offset + len(rows) < total
             return PaginatedMessages(
-                messages=[self.response_schema.model_validate(self._prepare_data(msg.__dict__)) for msg in messages],
+                messages=[self.response_schema.model_validate(dict(row)) for row in rows],
                 total=total,
                 page=page,
-                page_size=page_size
+                page_size=page_size,
+                next_cursor=encode_cursor(rows[-1]["timestamp"], rows[-1]["id"]) if has_more else None
             )
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid session ID")
         except Exception as e:
-            logger.error(f"Error retrieving messages: {str(e)}")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve messages")
\ No newline at end of file
+            logger.error("Error retrieving messages: %s", e)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve messages")
+
+    async def _get_page_by_cursor(
+        self,
+        session_id_value: uuid.UUID,
+        page_size: int,
+        cursor: Tuple[datetime, uuid.UUID]
+    ) -> PaginatedMessages:
+        """
+        Retrieves the page of messages that follows the given cursor using keyset pagination.
+        Fetches one extra row to detect whether another page exists, so the cost stays
+        bounded by the page size regardless of how deep the client has paged.
+        Args:
+            session_id_value (uuid.UUID): The UUID of the session to retrieve messages for.
+            page_size (int): The number of messages per page.
+            cursor (Tuple[datetime, uuid.UUID]): The (timestamp, id) of the last message already seen.
+        Returns:
+            PaginatedMessages: A paginated response without a total count.
+        """
+        rows = await self._fetch_rows(
+            select(*self.model.__table__.c)
+            .filter(self.model.session_id == session_id_value)
+            .filter(tuple_(self.model.timestamp, self.model.id) < tuple_(*cursor))
+            .order_by(self.model.timestamp.desc(), self.model.id.desc())
+            .limit(page_size + 1),
+            page_size
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        return PaginatedMessages(
+            messages=[self.response_schema.model_validate(dict(row)) for row in rows],
+            total=None,
+            page_size=page_size,
+            next_cursor=encode_cursor(rows[-1]["timestamp"], rows[-1]["id"]) if has_more else None
+        )
+
+    async def _fetch_rows(self, stmt: Select, page_size: int) -> List[RowMapping]:
+        """
+        Executes a column-projected page query and returns plain row mappings, bypassing ORM
+        instance construction. Small pages are fetched in one go; pages above STREAM_YIELD_PER
+        rows are read through a server-side cursor in chunks so memory grows incrementally.
+        Args:
+            stmt (Select): The page query to execute.
+            page_size (int): The requested page size.
+        Returns:
+            List[RowMapping]: The fetched rows, keyed by column name.
+        """
+        if page_size <= STREAM_YIELD_PER:
+            result = await self.db.execute(stmt)
+            return result.mappings().all()
+        result = await self.db.stream(stmt.execution_options(yield_per=STREAM_YIELD_PER))
+        return [row async for row in result.mappings()]
@@ -0,0 +1,36 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.repositories.message import MessageRepository
+from app.repositories.session import ChatSessionRepository
+
+DBSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+async def get_message_repo(db: DBSession) -> MessageRepository:
+    """
+    Dependency that provides a MessageRepository bound to the request's database session.
+    Args:
+        db (AsyncSession): The database session for the request.
+    Returns:
+        MessageRepository: The repository for the request.
+    """
+    return MessageRepository(db)
+
+
+async def get_session_repo(db: DBSession) -> ChatSessionRepository:
+    """
+    Dependency that provides a ChatSessionRepository bound to the request's database session.
+    Args:
+        db (AsyncSession): The database session for the request.
+    Returns:
+        ChatSessionRepository: The repository for the request.
+    """
+    return ChatSessionRepository(db)
+
+
+# Reusable dependency aliases for route signatures
+MsgRepo = Annotated[MessageRepository, Depends(get_message_repo)]
+SessionRepo = Annotated[ChatSessionRepository, Depends(get_session_repo)]
@@ -1,39 +1,33 @@
-import logging
-from fastapi import APIRouter, Depends, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Body, Depends, Query, HTTPException, status
 
-from app.database import get_db
 from app.models.message import Message, MessageResponse
 from app.models.pagination import PaginatedMessages
 from app.utils.auth import verify_api_key
-from app.repositories.message import MessageRepository
+from app.routes.deps import MsgRepo
+from app.utils.helper import decode_cursor
 
 
-router = APIRouter()
-logger = logging.getLogger(__name__)
+# API key verification is shared by every message route, so it is declared once on the router
+router = APIRouter(dependencies=[Depends(verify_api_key)])
 
-limiter = Limiter(key_func=get_remote_address)
+# Upper bound on messages per batch request, so one request cannot hold an unbounded transaction
+MAX_BATCH_SIZE = 100
 
 @router.post("/sessions/{session_id}/messages", response_model=MessageResponse)
-@limiter.limit("10/minute")
 async def add_message(
-    session_id: str,
+    session_id: uuid.UUID,
     message_data: Message,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    repo: MsgRepo
 ):
     """
     ### Add a new message to a chat session
 
     **Parameters:**
-    - `session_id` (str): The UUID of the session to which the message belongs.
+    - `session_id` (uuid.UUID): The UUID of the session to which the message belongs.
     - `message_data` (Message): The message data to be added.
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `repo` (MessageRepository): The message repository dependency.
 
     **Returns:**
     - `MessageResponse`: The response model containing the added message.
@@ -42,38 +36,63 @@ async def add_message(
     - `HTTPException`: If the session ID is invalid or if an error occurs during message creation.
     """
 
-    repo = MessageRepository(db)
-    message_data_dict = message_data.model_dump()
-    message_data_dict["session_id"] = session_id
-    return await repo.create(Message(**message_data_dict))
+    created = await repo.create_many([message_data.model_copy(update={"session_id": session_id})])
+    return created[0]
+
+@router.post("/sessions/{session_id}/messages/batch", response_model=List[MessageResponse])
+async def add_messages(
+    session_id: uuid.UUID,
+    messages_data: Annotated[List[Message], Body(max_length=MAX_BATCH_SIZE)],
+    repo: MsgRepo
+):
+    """
+    ### Add multiple messages to a chat session in one request
+
+    **Parameters:**
+    - `session_id` (uuid.UUID): The UUID of the session to which the messages belong.
+    - `messages_data` (List[Message]): The messages to be added, in order (at most `MAX_BATCH_SIZE`).
+    - `repo` (MessageRepository): The message repository dependency.
+
+    **Returns:**
+    - `List[MessageResponse]`: The added messages, in the order they were sent.
+
+    **Raises:**
+    - `HTTPException`: If the session ID is invalid or if an error occurs during message creation.
+    """
+
+    messages = [message.model_copy(update={"session_id": session_id}) for message in messages_data]
+    return await repo.create_many(messages)
 
 @router.get("/sessions/{session_id}/messages", response_model=PaginatedMessages)
-@limiter.limit("10/minute")
 async def get_messages(
-    request: Request,
-    session_id: str,
-    page: int = 1,
-    page_size: int = 10,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    session_id: uuid.UUID,
+    repo: MsgRepo,
+    page: int = Query(1, ge=1, deprecated=True),
+    page_size: int = Query(10, ge=1),
+    cursor: Optional[str] = None
 ):
     """
     ### Retrieve messages for a specific chat session with pagination
 
+    Messages are returned newest first. Pass the `next_cursor` from a previous response as
+    `cursor` to fetch the following page; page-number pagination is deprecated.
+
     **Parameters:**
-    - `session_id` (str): The UUID of the session to retrieve messages for.
-    - `page` (int, optional): The page number to retrieve (default is 1).
+    - `session_id` (uuid.UUID): The UUID of the session to retrieve messages for.
+    - `page` (int, optional): The page number to retrieve (default is 1). Deprecated, ignored when `cursor` is set.
     - `page_size` (int, optional): The number of messages per page (default is 10).
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `cursor` (str, optional): The `next_cursor` value from the previous page.
+    - `repo` (MessageRepository): The message repository dependency.
 
     **Returns:**
     - `PaginatedMessages`: A paginated response containing messages and metadata.
 
     **Raises:**
-    - `HTTPException`: If the session ID is invalid or if an error occurs during retrieval.
+    - `HTTPException`: If the session ID or cursor is invalid or if an error occurs during retrieval.
     """
 
-    repo = MessageRepository(db)
-    return await repo.get_by_session_id(session_id, page, page_size)
\ No newline at end of file
+    try:
+        cursor_value = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return await repo.get_by_session_id(session_id, page, page_size, cursor_value)
\ No newline at end of file
@@ -1,35 +1,29 @@
-import logging
 import uuid
-from fastapi import APIRouter, Depends, Request, HTTPException, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from app.models.session import ChatSessionCreate, ChatSessionUpdate, ChatSessionResponse
 from app.utils.auth import verify_api_key
-from app.repositories.session import ChatSessionRepository
+from app.routes.deps import SessionRepo
 
-router = APIRouter()
-logger = logging.getLogger(__name__)
+# API key verification is shared by every session route, so it is declared once on the router
+router = APIRouter(dependencies=[Depends(verify_api_key)])
 
-limiter = Limiter(key_func=get_remote_address)
+# Handlers return ORJSONResponse directly: the repository already yields a validated
+# ChatSessionResponse, so FastAPI's response_model pass would only re-validate it.
+# response_model is kept for the OpenAPI schema. Dumping in JSON mode turns asyncpg's UUID
+# subclass (which orjson rejects) into a string and formats datetimes like the message routes.
 
 @router.post("/sessions", response_model=ChatSessionResponse)
-@limiter.limit("10/minute")
 async def create_session(
     session_data: ChatSessionCreate,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    repo: SessionRepo
 ):
     """
     ### Create a new chat session
 
     **Parameters:**
     - `session_data` (ChatSessionCreate): The data for the new chat session.
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `repo` (ChatSessionRepository): The chat session repository dependency.
 
     **Returns:**
     - `ChatSessionResponse`: The response model containing the created session.
@@ -38,29 +32,20 @@ async def create_session(
     - `HTTPException`: If an error occurs during session creation.
     """
 
-    repo = ChatSessionRepository(db)
-    try:
-        return await repo.create(session_data)
-    except Exception as e:
-        logger.error(f"Error creating session: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create session")
+    session = await repo.create(session_data)
+    return ORJSONResponse(session.model_dump(mode="json"))
 
 @router.get("/sessions/{session_id}", response_model=ChatSessionResponse)
-@limiter.limit("10/minute")
 async def get_session(
-    session_id: str,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    session_id: uuid.UUID,
+    repo: SessionRepo
 ):
     """
     ### Retrieve a chat session by its ID
 
     **Parameters:**
-    - `session_id` (str): The UUID of the session to retrieve.
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `session_id` (uuid.UUID): The UUID of the session to retrieve.
+    - `repo` (ChatSessionRepository): The chat session repository dependency.
 
     **Returns:**
     - `ChatSessionResponse`: The response model containing the retrieved session.
@@ -68,37 +53,22 @@ async def get_session(
     **Raises:**
     - `HTTPException`: If the session ID is invalid or if an error occurs during retrieval.
     """
-    try:
-        session_id_uuid = uuid.UUID(session_id)
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid session ID")
-    repo = ChatSessionRepository(db)
-    try:
-        return await repo.get(session_id)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error retrieving session: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve session")
+    session = await repo.get(session_id)
+    return ORJSONResponse(session.model_dump(mode="json"))
 
 @router.put("/sessions/{session_id}", response_model=ChatSessionResponse)
-@limiter.limit("10/minute")
 async def update_session(
-    session_id: str,
+    session_id: uuid.UUID,
     session_data: ChatSessionUpdate,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    repo: SessionRepo
 ):
     """
     ### Update an existing chat session
 
     **Parameters:**
-    - `session_id` (str): The UUID of the session to update.
+    - `session_id` (uuid.UUID): The UUID of the session to update.
     - `session_data` (ChatSessionUpdate): The updated data for the chat session.
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `repo` (ChatSessionRepository): The chat session repository dependency.
 
     **Returns:**
     - `ChatSessionResponse`: The response model containing the updated session.
@@ -107,35 +77,20 @@ async def update_session(
     - `HTTPException`: If the session ID is invalid or if an error occurs during update.
     """
 
-    try:
-        session_id_uuid = uuid.UUID(session_id)
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid session ID")
-    repo = ChatSessionRepository(db)
-    try:
-        return await repo.update(session_id, session_data)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating session: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update session")
+    session = await repo.update(session_id, session_data)
+    return ORJSONResponse(session.model_dump(mode="json"))
 
 @router.delete("/sessions/{session_id}")
-@limiter.limit("10/minute")
 async def delete_session(
-    session_id: str,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    api_key: str = Depends(verify_api_key)
+    session_id: uuid.UUID,
+    repo: SessionRepo
 ):
     """
     ### Delete a chat session by its ID
 
     **Parameters:**
-    - `session_id` (str): The UUID of the session to delete.
-    - `request` (Request): The FastAPI request object.
-    - `db` (AsyncSession): The database session dependency.
-    - `api_key` (str): The API key for authentication.
+    - `session_id` (uuid.UUID): The UUID of the session to delete.
+    - `repo` (ChatSessionRepository): The chat session repository dependency.
 
     **Returns:**
     - `dict`: A dictionary containing a success message.
@@ -144,15 +99,4 @@ async def delete_session(
     - `HTTPException`: If the session ID is invalid or if an error occurs during deletion.
     """
 
-    try:
-        session_id_uuid = uuid.UUID(session_id)
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid session ID")
-    repo = ChatSessionRepository(db)
-    try:
-        return await repo.delete(session_id)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting session: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete session")
\ No newline at end of file
+    return await repo.delete(session_id)
\ No newline at end of file
@@ -1,11 +1,22 @@
 import asyncio
+import os
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
+
+# APIKeyMiddleware checks the key before dependencies run, so tests use a known key
+os.environ["API_KEY"] = "test_api_key"
+
 from app.main import app
 from app.utils.auth import verify_api_key
 from app.database import get_db
+from app.utils.rate_limiter import limiter
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 
 # Override API key dependency for testing
@@ -17,34 +28,42 @@ async def override_verify_api_key():
 
 app.dependency_overrides[verify_api_key] = override_verify_api_key
 
-@pytest.fixture
+# The shared clients all come from one address, so per-IP limits would trip mid-suite
+limiter.enabled = False
+
+@pytest.fixture(scope="session")
 def client():
     """
-    Create a TestClient for the FastAPI app.
+    Create a TestClient for the FastAPI app, shared across the test session.
+    Not entered as a context manager: running the lifespan on TestClient's own loop
+    would bind pooled DB connections to a different loop than the async tests use.
     """
     return TestClient(app)
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client():
     """
-    Create an AsyncClient for the FastAPI app using ASGITransport.
+    Create an AsyncClient for the FastAPI app using ASGITransport, shared across the test session.
+    Async fixtures and tests all run on the session event loop: the engine's pool is module-level,
+    so a pooled asyncpg connection must not outlive the loop it was opened on.
     """
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def db_session():
     """
     Create a database session for testing.
+    Sessions come from the shared engine's pool, so connections are reused across tests.
     """
     async for session in get_db():
         yield session
 
 @pytest.fixture(scope="session")
-def event_loop():
+def event_loop_policy():
     """
-    Create a new event loop for the test session.
+    Provide the event loop policy for async tests, using uvloop where it is available.
     """
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
\ No newline at end of file
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
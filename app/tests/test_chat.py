@@ -1,63 +1,11 @@
-import asyncio
 import pytest
 import uuid
-import pytest_asyncio
-from fastapi.testclient import TestClient
-from httpx import AsyncClient, ASGITransport
 from sqlalchemy import select
-from app.main import app
-from app.utils.auth import verify_api_key
-from app.database import get_db, Message
+from app.database import Message
 
 
-@pytest.fixture
-def client():
-    """
-    Create a TestClient for the FastAPI app.
-    This fixture can be used to make synchronous requests to the app during tests.
-    """
-    return TestClient(app)
-
-# Override API key dependency for testing
-async def override_verify_api_key():
-    """
-    Override the verify_api_key dependency to return a fixed API key for testing.
-    This allows tests to bypass actual API key verification.
-    """
-    return "test_api_key"
-
-app.dependency_overrides[verify_api_key] = override_verify_api_key
-
-@pytest_asyncio.fixture
-async def async_client():
-    """
-    Create an AsyncClient for the FastAPI app using ASGITransport.
-    This fixture can be used to make asynchronous requests to the app during tests.
-    """
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
-
-@pytest_asyncio.fixture
-async def db_session():
-    """
-    Create a database session for testing.
-    This fixture can be used to interact with the database during tests.
-    """
-    async for session in get_db():
-        yield session
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """
-    Create a new event loop for the test session.
-    This fixture ensures that each test session has its own event loop.
-    """
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
 # Test Cases
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_health_check(client):
     """
     Test the health check endpoint to ensure the service is running.
@@ -67,7 +15,7 @@ async def test_health_check(client):
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_create_session(async_client, db_session):
     """
     Test the creation of a chat session.
@@ -84,7 +32,7 @@ async def test_create_session(async_client, db_session):
     assert data["name"] == "Test Session"
     assert "id" in data
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_session(async_client, db_session):
     """
     Test updating a chat session.
@@ -112,7 +60,7 @@ async def test_update_session(async_client, db_session):
     assert data["id"] == session_id
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_delete_session_cascades_messages(async_client, db_session):
     """
     Test that deleting a chat session also deletes associated messages.
@@ -153,7 +101,7 @@ async def test_delete_session_cascades_messages(async_client, db_session):
     )
     assert result.scalars().first() is None
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_add_message(async_client, db_session):
     """
     Test adding a message to a chat session.
@@ -185,7 +133,7 @@ async def test_add_message(async_client, db_session):
     assert data["context"] == {"rag_data": "Some context"}
     assert data["session_id"] == session_id
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_messages(async_client, db_session):
     """
     Test retrieving messages from a chat session.
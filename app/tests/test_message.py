@@ -1,7 +1,10 @@
+import asyncio
 import pytest
-from datetime import datetime, timezone
+from sqlalchemy import event
+from app.database.engine import engine
+from app.routes.message import MAX_BATCH_SIZE
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_add_message(async_client, db_session):
     """
     Test adding a message to a chat session.
@@ -30,7 +33,7 @@ async def test_add_message(async_client, db_session):
     assert data["context"] == {"rag_data": "Some context"}
     assert data["session_id"] == session_id
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_get_messages(async_client, db_session):
     """
     Test retrieving messages from a chat session.
@@ -59,4 +62,144 @@ async def test_get_messages(async_client, db_session):
     assert data["page_size"] == 10
     assert data["total"] == 1
     assert len(data["messages"]) == 1
-    assert data["messages"][0]["content"] == "Test message"
\ No newline at end of file
+    assert data["messages"][0]["content"] == "Test message"
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_add_messages_batch(async_client, db_session):
+    """
+    Test adding several messages to a chat session in a single request.
+    """
+    create_response = await async_client.post(
+        "/chat/sessions",
+        json={"user_id": "test_user"},
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert create_response.status_code == 200, f"Create session failed: {create_response.text}"
+    session_id = create_response.json()["id"]
+
+    response = await async_client.post(
+        f"/chat/sessions/{session_id}/messages/batch",
+        json=[
+            {"sender": "user", "content": "First message", "context": {}},
+            {"sender": "assistant", "content": "Second message", "context": {"rag_data": "Some context"}}
+        ],
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 200, f"Add messages failed: {response.text}"
+    data = response.json()
+    assert len(data) == 2
+    assert [m["content"] for m in data] == ["First message", "Second message"]
+    assert all(m["session_id"] == session_id for m in data)
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_add_messages_batch_single_insert(async_client, db_session):
+    """
+    Test that a batch of messages is written with one INSERT statement and that oversized batches are rejected.
+    """
+    create_response = await async_client.post(
+        "/chat/sessions",
+        json={"user_id": "test_user"},
+        headers={"X-API-Key": "test_api_key"}
+    )
+    session_id = create_response.json()["id"]
+
+    inserts = []
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO MESSAGES"):
+            inserts.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        response = await async_client.post(
+            f"/chat/sessions/{session_id}/messages/batch",
+            json=[{"sender": "user", "content": f"Message {i}"} for i in range(5)],
+            headers={"X-API-Key": "test_api_key"}
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_inserts)
+    assert response.status_code == 200, f"Add messages failed: {response.text}"
+    assert [m["content"] for m in response.json()] == [f"Message {i}" for i in range(5)]
+    assert len(inserts) == 1
+
+    response = await async_client.post(
+        f"/chat/sessions/{session_id}/messages/batch",
+        json=[{"sender": "user", "content": "Message"}] * (MAX_BATCH_SIZE + 1),
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 422
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_messages_with_cursor(async_client, db_session):
+    """
+    Test paging through a chat session's messages with keyset cursors.
+    """
+    create_response = await async_client.post(
+        "/chat/sessions",
+        json={"user_id": "test_user"},
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert create_response.status_code == 200, f"Create session failed: {create_response.text}"
+    session_id = create_response.json()["id"]
+
+    # Inserts are independent (explicit timestamps fix the order), so send them concurrently
+    responses = await asyncio.gather(*(
+        async_client.post(
+            f"/chat/sessions/{session_id}/messages",
+            json={"sender": "user", "content": content, "context": {}, "timestamp": f"2025-01-01T00:00:0{second}Z"},
+            headers={"X-API-Key": "test_api_key"}
+        )
+        for second, content in enumerate(["First", "Second", "Third"])
+    ))
+    assert all(r.status_code == 200 for r in responses)
+
+    response = await async_client.get(
+        f"/chat/sessions/{session_id}/messages?page_size=2",
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 200, f"Get messages failed: {response.text}"
+    first_page = response.json()
+    assert first_page["total"] == 3
+    assert [m["content"] for m in first_page["messages"]] == ["Third", "Second"]
+    assert first_page["next_cursor"] is not None
+
+    response = await async_client.get(
+        f"/chat/sessions/{session_id}/messages",
+        params={"page_size": 2, "cursor": first_page["next_cursor"]},
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 200, f"Get messages failed: {response.text}"
+    second_page = response.json()
+    assert [m["content"] for m in second_page["messages"]] == ["First"]
+    assert second_page["next_cursor"] is None
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_messages_invalid_cursor(async_client, db_session):
+    """
+    Test that a malformed cursor is rejected.
+    """
+    create_response = await async_client.post(
+        "/chat/sessions",
+        json={"user_id": "test_user"},
+        headers={"X-API-Key": "test_api_key"}
+    )
+    session_id = create_response.json()["id"]
+
+    response = await async_client.get(
+        f"/chat/sessions/{session_id}/messages?cursor=not-a-cursor",
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_messages_invalid_page_size(async_client, db_session):
+    """
+    Test that non-positive page and page_size values are rejected before reaching the database.
+    """
+    session_id = "00000000-0000-0000-0000-000000000000"
+    for query in ("page_size=0", "page_size=-1", "page=0"):
+        response = await async_client.get(
+            f"/chat/sessions/{session_id}/messages?{query}",
+            headers={"X-API-Key": "test_api_key"}
+        )
+        assert response.status_code == 422, f"{query} was not rejected: {response.text}"
@@ -0,0 +1,59 @@
+import pytest
+from limits import parse
+from starlette.requests import Request
+from app.utils import rate_limiter
+from app.utils.rate_limiter import limiter, _client_key, DEFAULT_RATE_LIMIT
+
+
+def make_request(client=None, headers=()):
+    """
+    Build a bare Request from an ASGI scope with the given peer address and raw headers.
+    """
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": list(headers), "client": client})
+
+def test_client_key_uses_peer_address():
+    """
+    Test that the limiter key is the peer address from the ASGI scope.
+    """
+    assert _client_key(make_request(client=("10.0.0.1", 5000))) == "10.0.0.1"
+
+def test_client_key_without_client():
+    """
+    Test that requests without a known peer share the "anon" key.
+    """
+    assert _client_key(make_request()) == "anon"
+
+def test_client_key_forwarded_for(monkeypatch):
+    """
+    Test that X-Forwarded-For is only trusted when RATE_LIMIT_TRUST_PROXY is enabled.
+    """
+    request = make_request(
+        client=("10.0.0.1", 5000),
+        headers=[(b"x-forwarded-for", b"203.0.113.7, 10.0.0.2")]
+    )
+    assert _client_key(request) == "10.0.0.1"
+
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_TRUST_PROXY", True)
+    assert _client_key(request) == "203.0.113.7"
+
+def test_rate_limit_enforced(client):
+    """
+    Test that requests past the default limit get 429 while /health and /openapi.json are never throttled.
+    """
+    limit = parse(DEFAULT_RATE_LIMIT).amount
+    limiter.reset()
+    limiter.enabled = True
+    try:
+        # An invalid session id is rejected with 422 before touching the database, but still counts
+        for _ in range(limit):
+            response = client.get("/chat/sessions/not-a-uuid", headers={"X-API-Key": "test_api_key"})
+            assert response.status_code == 422
+        response = client.get("/chat/sessions/not-a-uuid", headers={"X-API-Key": "test_api_key"})
+        assert response.status_code == 429
+
+        for _ in range(limit + 1):
+            assert client.get("/health").status_code == 200
+            assert client.get("/openapi.json").status_code == 200
+    finally:
+        limiter.enabled = False
+        limiter.reset()
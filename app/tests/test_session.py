@@ -3,7 +3,7 @@ import uuid
 from sqlalchemy import select
 from app.database import Message
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_health_check(client):
     """
     Test the health check endpoint to ensure the service is running.
@@ -12,7 +12,7 @@ async def test_health_check(client):
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_create_session(async_client, db_session):
     """
     Test the creation of a chat session.
@@ -26,9 +26,9 @@ async def test_create_session(async_client, db_session):
     data = response.json()
     assert data["user_id"] == "test_user"
     assert data["name"] == "Test Session"
-    assert "id" in data
+    assert uuid.UUID(data["id"]).version == 7
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_update_session(async_client, db_session):
     """
     Test updating a chat session.
@@ -52,7 +52,7 @@ async def test_update_session(async_client, db_session):
     assert data["is_favorite"] is True
     assert data["id"] == session_id
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_delete_session_cascades_messages(async_client, db_session):
     """
     Test that deleting a chat session also deletes associated messages.
@@ -90,4 +90,28 @@ async def test_delete_session_cascades_messages(async_client, db_session):
     result = await db_session.execute(
         select(Message).filter_by(session_id=uuid.UUID(session_id))
     )
-    assert result.scalars().first() is None
\ No newline at end of file
+    assert result.scalars().first() is None
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_session_invalid_id(async_client, db_session):
+    """
+    Test that a malformed session ID is rejected by path validation.
+    """
+    response = await async_client.get(
+        "/chat/sessions/not-a-uuid",
+        headers={"X-API-Key": "test_api_key"}
+    )
+    assert response.status_code == 422
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_invalid_api_key_rejected(async_client):
+    """
+    Test that requests with a wrong API key are rejected before reaching the routes.
+    """
+    response = await async_client.post(
+        "/chat/sessions",
+        json={"user_id": "test_user"},
+        headers={"X-API-Key": "wrong_key"}
+    )
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid API key"}
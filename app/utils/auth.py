@@ -1,13 +1,31 @@
 from fastapi import Security, HTTPException, status
 from fastapi.security import APIKeyHeader
+from fastapi.responses import JSONResponse
+import hmac
+from functools import lru_cache
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
 API_KEY = os.getenv("API_KEY")
+# Encoded once at import so each request only performs the comparison
+_API_KEY_BYTES = (API_KEY or "").encode()
 api_key_header = APIKeyHeader(name="X-API-Key")
 
+@lru_cache(maxsize=1024)
+def _check_api_key(api_key: str) -> bool:
+    """
+    Check an API key against the configured key, caching the result per header value.
+    The cache is bounded, so invalid keys sent by scanners are evicted over time.
+    Args:
+        api_key (str): The API key from the request header.
+    Returns:
+        bool: True if the key matches the configured API key.
+    """
+    # Constant-time comparison avoids leaking how much of the key matched
+    return bool(_API_KEY_BYTES) and hmac.compare_digest(api_key.encode(), _API_KEY_BYTES)
+
 async def verify_api_key(api_key: str = Security(api_key_header)):
     """
     Verify the API key provided in the request header.
@@ -18,9 +36,44 @@ async def verify_api_key(api_key: str = Security(api_key_header)):
     Raises:
         HTTPException: If the API key is invalid or not provided.
     """
-    if api_key != API_KEY:
+    if not _check_api_key(api_key):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
         )
-    return api_key
\ No newline at end of file
+    return api_key
+
+
+class APIKeyMiddleware:
+    """
+    ASGI middleware that rejects requests without a valid X-API-Key before routing.
+    Unauthenticated traffic is answered with a 401 straight from the raw ASGI scope, without
+    building a Request or resolving route dependencies. CORS preflight (OPTIONS) requests are
+    let through. `verify_api_key` stays on the routes so the scheme is documented in OpenAPI.
+    Attributes:
+        app: The wrapped ASGI application.
+        protected_prefixes (tuple): Path prefixes that require an API key.
+    """
+
+    def __init__(self, app, protected_prefixes: tuple = ("/chat/",)):
+        """
+        Initializes the middleware.
+        Args:
+            app: The ASGI application to wrap.
+            protected_prefixes (tuple): Path prefixes that require an API key.
+        """
+        self.app = app
+        self.protected_prefixes = protected_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["method"] != "OPTIONS"
+            and scope["path"].startswith(self.protected_prefixes)
+        ):
+            api_key = next((value for name, value in scope["headers"] if name == b"x-api-key"), b"")
+            if not _check_api_key(api_key.decode("latin-1")):
+                response = JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={"detail": "Invalid API key"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
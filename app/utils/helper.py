@@ -1,12 +1,45 @@
+import base64
+import binascii
+import uuid
 from datetime import datetime, timezone
+from typing import Tuple
 
-def utcnow_naive():
-    """Returns the current UTC time as a naive datetime object.
-    This function is used to ensure that the datetime objects stored in the database
-    do not include timezone information, which is important for compatibility with
-    certain database configurations and libraries.
+# Bound once so the hot insert path skips the attribute lookup
+_UTC = timezone.utc
+
+def utcnow():
+    """Returns the current UTC time as a timezone-aware datetime object.
+    The timestamp columns are TIMESTAMP WITH TIME ZONE, so an aware value is stored as-is;
+    a naive one would be interpreted in the server process's local timezone by asyncpg.
+    Returns:
+        datetime: The current UTC time, with tzinfo set to UTC.
+    """
+    return datetime.now(_UTC)
+
+
+def encode_cursor(timestamp: datetime, id: uuid.UUID) -> str:
+    """Encodes a (timestamp, id) keyset pagination position as an opaque URL-safe string.
+    Args:
+        timestamp (datetime): Timestamp of the last item on the current page.
+        id (uuid.UUID): ID of the last item on the current page.
+    Returns:
+        str: The encoded cursor.
+    """
+    raw = f"{timestamp.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decodes a cursor produced by `encode_cursor`.
+    Args:
+        cursor (str): The encoded cursor.
     Returns:
-        datetime: The current UTC time as a naive datetime object.
+        Tuple[datetime, uuid.UUID]: The (timestamp, id) position the cursor points at.
+    Raises:
+        ValueError: If the cursor is malformed.
     """
-    return datetime.now(timezone.utc)
-    
\ No newline at end of file
+    try:
+        timestamp, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), uuid.UUID(id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -1,16 +1,36 @@
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_listener = None
 
 def setup_logger():
     """Setup the logger for the application.
     This function configures the logging settings for the application, including log level, format, and handlers.
-    It sets up both console and file handlers to capture logs.
-    The log level is set to INFO, and logs are formatted to include the timestamp, logger name, log level, and message.
+    Records are handed to a queue on the calling thread and written to the console and a rotating app.log
+    by a background QueueListener, so file and stream I/O never blocks the event loop.
+    The log level is read from LOG_LEVEL (default INFO; use WARNING in production), and logs are formatted to include the timestamp, logger name, log level, and message.
+    SQLAlchemy's engine logger is capped at WARNING; set SQL_ECHO=true to trace queries during development.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler("app.log")
-        ]
-    )
\ No newline at end of file
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    file_handler = RotatingFileHandler("app.log", maxBytes=10 * 1024 * 1024, backupCount=5)
+    file_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
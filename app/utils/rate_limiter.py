@@ -1,8 +1,54 @@
+import os
+from limits import parse
 from slowapi import Limiter
-from slowapi.util import get_remote_address
+from starlette.requests import Request
+from dotenv import load_dotenv
+
+load_dotenv()
 
 """ Rate Limiter Configuration
-This module sets up a rate limiter for the application using SlowAPI.
-It uses the client's IP address as the key for rate limiting.
+This module sets up the single rate limiter shared by the application using SlowAPI.
+It uses the client's IP address, read straight from the ASGI scope, as the key for rate limiting.
+Set RATE_LIMIT_TRUST_PROXY=true behind a reverse proxy to key on the first X-Forwarded-For address instead.
+Counters live in the storage given by RATE_LIMIT_STORAGE_URI: use a Redis URI
+(e.g. redis://redis:6379/0) so limits are shared across workers and replicas; the
+default in-process memory storage only suits single-process development.
+The fixed-window strategy costs one atomic INCR/EXPIRE per hit, unlike the moving window
+whose cost grows with the limit. The storage connection pool is created once with the limiter.
+Limits are enforced by SlowAPIASGIMiddleware (registered in app/main.py), which applies
+DEFAULT_RATE_LIMIT to every route per client IP; use `limiter.exempt` to opt a route out.
 """
-limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+DEFAULT_RATE_LIMIT = os.getenv("RATE_LIMIT", "10/minute")
+# Parse once at import so a malformed RATE_LIMIT fails at startup rather than on the first request
+parse(DEFAULT_RATE_LIMIT)
+
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+
+
+def _client_key(request: Request) -> str:
+    """Returns the rate limit key for a request.
+    Reads the peer address from the ASGI scope and, when RATE_LIMIT_TRUST_PROXY is enabled,
+    the first X-Forwarded-For entry from the raw header list, without building header mappings.
+    Args:
+        request (Request): The incoming request.
+    Returns:
+        str: The client IP address, or "anon" when it is unknown.
+    """
+    scope = request.scope
+    if RATE_LIMIT_TRUST_PROXY:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.split(b",", 1)[0].strip().decode("latin-1")
+    client = scope.get("client")
+    return client[0] if client else "anon"
+
+
+limiter = Limiter(
+    key_func=_client_key,
+    default_limits=[DEFAULT_RATE_LIMIT],
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="fixed-window",
+    # Keep serving with per-process limits if Redis becomes unreachable
+    in_memory_fallback_enabled=True
+)